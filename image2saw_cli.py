@@ -7,28 +7,42 @@ import argparse
 import wave
 import numpy as np
 
-from image2saw_core.image_io import load_image, full_image_tile
-from image2saw_core.engine import EngineConfig, init_engine_state, render_buffer
+try:
+    import soundfile as sf  # optional: libsndfile-backed WAV writing
+except ImportError:
+    sf = None
 
-# Maximum value for 16-bit signed integer audio
-INT16_MAX = 32767
+from image2saw_core.image_io import load_image, full_image_tile
+from image2saw_core.engine import EngineConfig, init_engine_state, render_cycle
+from image2saw_core import quantize_int16
 
-def write_wav_mono(path: str, sample_rate: int, data: np.ndarray) -> None:
+def write_wav_mono(path: str, sample_rate: int, data: np.ndarray, repeats: int = 1) -> None:
     """
     Write a mono float32 buffer in [-1,1] to a 16-bit PCM WAV file.
+
+    The buffer is written `repeats` times back to back, so a single loop-ready
+    cycle can be streamed out without building the tiled buffer.
+    Uses soundfile (libsndfile) when installed, Python's wave module otherwise.
     """
-    # Clamp
-    data = np.clip(data, -1.0, 1.0)
+    # Clamp + convert to int16 in one pass; every repeat reuses the same frames.
+    # (libsndfile does not clip float input by default, so we quantize here.)
+    int_data = quantize_int16(data)
 
-    # Convert to int16
-    int_data = (data * 32767.0).astype(np.int16)
+    if sf is not None:
+        with sf.SoundFile(path, 'w', samplerate=sample_rate, channels=1,
+                          format='WAV', subtype='PCM_16') as f:
+            for _ in range(repeats):
+                f.write(int_data)
+        return
 
     # Write using Python's standard library
+    frames = int_data.tobytes()
     with wave.open(path, 'wb') as w:
         w.setnchannels(1)
         w.setsampwidth(2)  # 16-bit
         w.setframerate(sample_rate)
-        w.writeframes(int_data.tobytes())
+        for _ in range(repeats):
+            w.writeframes(frames)
 
 def main():
     parser = argparse.ArgumentParser(description="image2saw Audio Generation")
@@ -59,12 +73,11 @@ def main():
     )
     engine_state = init_engine_state(tile, config)
 
-    # Render audio buffer
-    buffer = render_buffer(engine_state)
+    # Render one loop-ready cycle
+    single_cycle = render_cycle(engine_state)
 
-    # Save as WAV file
-    write_wav_mono(args.output, config.sample_rate, buffer)
-    # wavfile.write(args.output, args.sample_rate, buffer_int16)
+    # Save as WAV file, repeating the cycle num_cycles times
+    write_wav_mono(args.output, config.sample_rate, single_cycle, repeats=config.num_cycles)
     print(f"Audio saved to {args.output}")
 
 
@@ -10,7 +10,15 @@ from .mapping import (
     scalar_to_frequency,
     blend_gray_hsv,
 )
-from .engine import EngineConfig, VoiceState, EngineState, init_engine_state, render_buffer
+from .engine import (
+    EngineConfig,
+    EngineState,
+    init_engine_state,
+    render_cycle,
+    render_buffer,
+    render_buffer_parallel,
+)
+from ._kernels import quantize_int16
 
 __all__ = [
     "load_image",
@@ -21,8 +29,10 @@ __all__ = [
     "scalar_to_frequency",
     "blend_gray_hsv",
     "EngineConfig",
-    "VoiceState",
     "EngineState",
     "init_engine_state",
+    "render_cycle",
     "render_buffer",
+    "render_buffer_parallel",
+    "quantize_int16",
 ]
@@ -0,0 +1,153 @@
+"""
+_kernels.py: Optional Numba-compiled kernels for the render hot path.
+
+Numba is an optional dependency. When it is not installed, HAVE_NUMBA is
+False and the engine falls back to its pure NumPy implementation.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
+HAVE_NUMBA = numba is not None
+
+# Maximum value for 16-bit signed integer audio
+INT16_MAX = 32767
+
+# Fixed-point oscillator phase: the full uint32 range maps to [0,1)
+PHASE_ONE = 2.0 ** 32
+
+# Set once warmup() has compiled the kernels in this process
+_warm = False
+
+
+if HAVE_NUMBA:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def _render_kernel(incr_path, starts, osc_init, num_chunks):
+        """
+        Fused oscillator + mix for one tile cycle (one path index per sample).
+
+        Each voice streams through incr_path from its own start index, keeping
+        its oscillator phase in a register. Phases and increments are uint32
+        fixed point (full range == one period), so the wrap is the natural
+        integer overflow: no fmod, no compare. The sawtooth 2*phase - 1 is
+        the phase offset by half a period, read as int32, times 2^-31.
+        Voices are split into num_chunks groups, each accumulating into its
+        own partial row (no atomics), and the rows are reduced at the end.
+        """
+        path_length = incr_path.shape[0]
+        num_voices = starts.shape[0]
+        half = np.uint32(0x80000000)
+        scale = np.float32(1.0 / 2.0 ** 31)
+        partial = np.zeros((num_chunks, path_length), dtype=np.float32)
+
+        for c in numba.prange(num_chunks):
+            for v in range(c, num_voices, num_chunks):
+                phase = osc_init[v]
+                idx = starts[v]
+                for s in range(path_length):
+                    partial[c, s] += np.float32(np.int32(phase ^ half)) * scale
+                    phase = np.uint32(phase + incr_path[idx])
+                    idx += 1
+                    if idx == path_length:
+                        idx = 0
+
+        mixed = np.zeros(path_length, dtype=np.float32)
+        inv_voices = np.float32(1.0 / num_voices)
+        for c in range(num_chunks):
+            for s in range(path_length):
+                mixed[s] += partial[c, s]
+        for s in range(path_length):
+            mixed[s] *= inv_voices
+        return mixed
+
+    # No fastmath here: it lets LLVM assume finite inputs, and the clamp
+    # must saturate +/-inf like np.clip does.
+    @numba.njit(parallel=True, cache=True, boundscheck=False)
+    def _quantize_int16_kernel(data, out):
+        """
+        Single-pass saturating float -> int16 conversion (truncates toward 0).
+        Clamps to [-1,1] in float BEFORE converting, so huge or infinite
+        samples saturate instead of overflowing the integer conversion.
+        """
+        scale = np.float32(INT16_MAX)
+        lo = np.float32(-1.0)
+        hi = np.float32(1.0)
+        for i in numba.prange(data.shape[0]):
+            x = min(max(data[i], lo), hi)
+            out[i] = np.int16(x * scale)
+
+
+def render_cycle_numba(
+    freq_path: np.ndarray,
+    starts: np.ndarray,
+    osc_init: np.ndarray,
+    sample_rate: float,
+) -> np.ndarray:
+    """
+    Render one mixed tile cycle with the fused Numba kernel.
+
+    freq_path : (L,) frequency per scan-path index.
+    starts    : (V,) integer start index of each voice on the path.
+    osc_init  : (V,) initial oscillator phases in [0,1).
+
+    Returns an (L,) float32 buffer. Requires HAVE_NUMBA.
+    """
+    num_chunks = max(1, min(len(starts), numba.get_num_threads()))
+    return _render_kernel(
+        _to_fixed_phase(np.asarray(freq_path, dtype=np.float64) / float(sample_rate)),
+        np.ascontiguousarray(starts, dtype=np.int64),
+        _to_fixed_phase(np.asarray(osc_init, dtype=np.float64)),
+        num_chunks,
+    )
+
+
+def warmup() -> None:
+    """
+    Compile (or load from the on-disk cache) the Numba kernels once per
+    process, so the first real render does not pay for it. No-op without
+    Numba or when already warm.
+
+    Numba specializes on argument types, not shapes, so tiny inputs of the
+    right dtypes produce the same machine code as a full-size render.
+    """
+    global _warm
+    if not HAVE_NUMBA or _warm:
+        return
+    render_cycle_numba(
+        np.ones(2, dtype=np.float32),
+        np.zeros(1, dtype=np.int64),
+        np.zeros(1, dtype=np.float64),
+        44100.0,
+    )
+    quantize_int16(np.zeros(1, dtype=np.float32))
+    _warm = True
+
+
+def _to_fixed_phase(cycles: np.ndarray) -> np.ndarray:
+    """
+    Convert phases/increments in cycles to uint32 fixed point, wrapping mod 1.
+    """
+    fixed = np.mod(cycles * PHASE_ONE, PHASE_ONE)
+    # A value rounding up to exactly 2^32 wraps to 0 through the uint64 step.
+    return np.ascontiguousarray(fixed.astype(np.uint64).astype(np.uint32))
+
+
+def quantize_int16(data: np.ndarray) -> np.ndarray:
+    """
+    Convert a mono float buffer in [-1,1] to int16 PCM, saturating out-of-range
+    samples. Equivalent to np.clip(data, -1, 1) * 32767 cast to int16, but
+    done in one pass with Numba (or in place on one scratch buffer without).
+    """
+    data = np.ascontiguousarray(data, dtype=np.float32).reshape(-1)
+    if HAVE_NUMBA:
+        out = np.empty(data.shape, dtype=np.int16)
+        _quantize_int16_kernel(data, out)
+        return out
+    scaled = np.clip(data, -1.0, 1.0)
+    scaled *= np.float32(INT16_MAX)
+    return scaled.astype(np.int16)
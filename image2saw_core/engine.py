@@ -5,19 +5,18 @@ v0.2:
 - Vectorized rendering of a single tile cycle (NumPy).
 - Multiple voices, dephased on the scan-path and in oscillator phase.
 - Internal loop crossfade on the single cycle, then tiling for num_cycles.
+- Optional Numba kernel fusing oscillator and mix (see _kernels.py).
 """
 
-from dataclasses import dataclass
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+from typing import Dict, Optional, Tuple
+import os
 import numpy as np
 
 from .scan import build_scan_path
-from .mapping import (
-    pixel_to_scalar_gray,
-    pixel_to_scalar_hsv,
-    scalar_to_frequency,
-    blend_gray_hsv,
-)
+from . import _kernels
 
 
 @dataclass
@@ -44,28 +43,35 @@ class EngineConfig:
 
 
 @dataclass
-class VoiceState:
+class EngineState:
     """
-    Runtime state for a single voice.
+    Bundles configuration, scan path, tile data and voices.
 
-    phase     : position along the scan-path index space (0..path_length).
-    step      : phase increment per audio sample along the scan-path.
-    osc_phase : phase of the audio oscillator in [0,1) for this voice.
-    """
-    phase: float
-    step: float
-    osc_phase: float = 0.0
+    Voices are stored as struct-of-arrays, one (V,) array per field:
 
+    voice_phase     : position along the scan-path index space (0..path_length).
+    voice_step      : phase increment per audio sample along the scan-path.
+    voice_osc_phase : phase of the audio oscillator in [0,1) for each voice.
 
-@dataclass
-class EngineState:
-    """
-    Bundles configuration, scan path, tile data and voices.
+    freq_path caches the frequency of each scan-path index. It only depends
+    on the tile and on (mode, hsv_blend, fmin, fmax); freq_path_key records
+    those values so a config change triggers a rebuild on the next render.
+
+    loop_fade_out caches the loop crossfade ramp (see _get_loop_fade_out).
+
+    _scratch holds reusable work buffers for the (V, L) NumPy render path,
+    keyed by (name, shape, dtype), so repeated renders do not reallocate them.
     """
     config: EngineConfig
     scan_path: np.ndarray          # (N, 2) array of (y, x)
-    voices: List[VoiceState]
     tile_data: np.ndarray          # (H, W, 3) float32 RGB [0,1]
+    voice_phase: np.ndarray        # (V,) float64
+    voice_step: np.ndarray         # (V,) float64
+    voice_osc_phase: np.ndarray    # (V,) float64
+    freq_path: Optional[np.ndarray] = None   # (N,) float32 Hz
+    freq_path_key: Optional[Tuple] = None
+    loop_fade_out: Optional[np.ndarray] = None   # (fade_samples,) float32
+    _scratch: Dict[Tuple, np.ndarray] = field(default_factory=dict, repr=False, compare=False)
 
 
 def init_engine_state(tile: dict, config: EngineConfig) -> EngineState:
@@ -79,30 +85,32 @@ def init_engine_state(tile: dict, config: EngineConfig) -> EngineState:
     """
     width = tile["width"]
     height = tile["height"]
-    tile_data = tile["data"]
+    tile_data = np.asarray(tile["data"], dtype=np.float32)
 
     scan_path = build_scan_path(width, height, pattern="zigzag")
     path_length = len(scan_path)
 
     num_voices = max(1, config.num_voices)
-    voices: List[VoiceState] = []
+    v = np.arange(num_voices, dtype=np.float64)
 
-    for v in range(num_voices):
-        # Phase along the path: spread voices around the tile
-        phase = (path_length * v) / num_voices
-        step = 1.0  # 1 pixel (scan index) per audio sample in v0.2
+    # Phase along the path: spread voices around the tile
+    voice_phase = (path_length * v) / num_voices
+    # 1 pixel (scan index) per audio sample in v0.2
+    voice_step = np.ones(num_voices, dtype=np.float64)
+    # Oscillator initial phase: spread in [0,1) to avoid all voices in phase
+    voice_osc_phase = (v / num_voices) % 1.0
 
-        # Oscillator initial phase: spread in [0,1) to avoid all voices in phase
-        osc_phase = (v / num_voices) % 1.0
-
-        voices.append(VoiceState(phase=phase, step=step, osc_phase=osc_phase))
-
-    return EngineState(
+    engine_state = EngineState(
         config=config,
         scan_path=scan_path,
-        voices=voices,
         tile_data=tile_data,
+        voice_phase=voice_phase,
+        voice_step=voice_step,
+        voice_osc_phase=voice_osc_phase,
     )
+    _get_freq_path(engine_state)
+    _kernels.warmup()
+    return engine_state
 
 
 # ---------------------------------------------------------------------
@@ -110,142 +118,322 @@ def init_engine_state(tile: dict, config: EngineConfig) -> EngineState:
 # ---------------------------------------------------------------------
 
 
+def _freq_path_key(config: EngineConfig) -> Tuple:
+    """
+    Config values the per-path-index frequency table depends on.
+    """
+    return (config.mode, float(config.hsv_blend), float(config.fmin), float(config.fmax))
+
+
+def _compute_freq_path(config: EngineConfig, scan_path: np.ndarray, tile_data: np.ndarray) -> np.ndarray:
+    """
+    Map every scan-path pixel to its frequency: (L,) float32 in [fmin, fmax].
+
+    Every voice walks the same scan path, so the mapping only needs to be
+    evaluated on the L path pixels; voices then gather from this table.
+    """
+    fmin, fmax = np.float32(config.fmin), np.float32(config.fmax)
+
+    pixels_path = tile_data[scan_path[:, 0], scan_path[:, 1]]  # (L, 3)
+    r = pixels_path[:, 0]
+    g = pixels_path[:, 1]
+    b = pixels_path[:, 2]
+
+    # Grayscale luminance (approx) in [0,1]
+    gray_val = 0.2126 * r + 0.7152 * g + 0.0722 * b
+    gray_val = np.clip(gray_val, 0.0, 1.0)
+
+    # HSV-like value: use max channel as simple V substitute
+    hsv_val = np.maximum(np.maximum(r, g), b)
+    hsv_val = np.clip(hsv_val, 0.0, 1.0)
+
+    # One blend formula for every mode: only the weights depend on it.
+    # "hsv" blends gray and "V" by hsv_blend; "grayscale" (and, as a fallback,
+    # unknown modes) is the blend=0 case.
+    if config.mode == "hsv":
+        blend = float(np.clip(config.hsv_blend, 0.0, 1.0))
+    else:
+        blend = 0.0
+    scalar_path = (1.0 - blend) * gray_val + blend * hsv_val
+
+    return fmin + scalar_path * (fmax - fmin)  # (L,)
+
+
+def _get_freq_path(engine_state: EngineState) -> np.ndarray:
+    """
+    Return the cached freq_path, rebuilding it if the mapping config changed.
+    """
+    key = _freq_path_key(engine_state.config)
+    if engine_state.freq_path is None or engine_state.freq_path_key != key:
+        engine_state.freq_path = _compute_freq_path(
+            engine_state.config, engine_state.scan_path, engine_state.tile_data
+        )
+        engine_state.freq_path_key = key
+    return engine_state.freq_path
+
+
+def _render_one_voice(
+    freq_path: np.ndarray,
+    start: int,
+    osc_initial_phase: float,
+    sample_rate: float,
+) -> np.ndarray:
+    """
+    Sawtooth samples (L,) float32 for ONE voice stepping one path index per
+    sample from path index `start`. Only 1-D NumPy ops, which release the GIL,
+    so several voices can run concurrently on a thread pool.
+    """
+    path_length = len(freq_path)
+    inv_sr = np.float32(1.0 / sample_rate)
+
+    # increments[s] = freq_path[(start + s) % L] / sample_rate, written from
+    # the two contiguous slices of freq_path instead of a rolled copy.
+    increments = np.empty(path_length, dtype=np.float32)  # (L,)
+    np.multiply(freq_path[start:], inv_sr, out=increments[:path_length - start])
+    np.multiply(freq_path[:start], inv_sr, out=increments[path_length - start:])
+
+    # osc_phase[s] = osc_initial_phase + sum_{t=0..s-1} increments[t]
+    # (float64 accumulator, see _render_single_cycle_vectorized)
+    osc_phase = np.empty(path_length, dtype=np.float64)
+    osc_phase[0] = 0.0
+    np.cumsum(increments[:-1], dtype=np.float64, out=osc_phase[1:])
+    osc_phase += osc_initial_phase
+    np.mod(osc_phase, 1.0, out=osc_phase)
+
+    return np.float32(2.0) * osc_phase.astype(np.float32) - np.float32(1.0)
+
+
+def _scratch_buffer(scratch: Optional[Dict[Tuple, np.ndarray]], name: str, shape: Tuple, dtype) -> np.ndarray:
+    """
+    Return an uninitialized work buffer, reused from `scratch` when possible.
+    With scratch=None a fresh array is allocated.
+    """
+    if scratch is None:
+        return np.empty(shape, dtype=dtype)
+    key = (name, tuple(shape), np.dtype(dtype).str)
+    buf = scratch.get(key)
+    if buf is None:
+        buf = scratch[key] = np.empty(shape, dtype=dtype)
+    return buf
+
+
 def _render_single_cycle_vectorized(
     config: EngineConfig,
-    scan_path: np.ndarray,
-    tile_data: np.ndarray,
+    freq_path: np.ndarray,
     voice_phases: np.ndarray,
     voice_steps: np.ndarray,
     osc_initial_phases: np.ndarray,
+    scratch: Optional[Dict[Tuple, np.ndarray]] = None,
 ) -> np.ndarray:
     """
-    Generate a single cycle (length == len(scan_path)) of mixed audio using
+    Generate a single cycle (length == len(freq_path)) of mixed audio using
     fully vectorized NumPy operations.
 
     Parameters:
         config             : EngineConfig
-        scan_path          : (L, 2) int array of (y, x)
-        tile_data          : (H, W, 3) float32, RGB in [0,1]
+        freq_path          : (L,) float32 frequency per scan-path index
         voice_phases       : (V,) array of starting phases along the path (can be fractional)
         voice_steps        : (V,) array of step-per-sample values
         osc_initial_phases : (V,) array of initial oscillator phases in [0,1)
+        scratch            : optional buffer pool (EngineState._scratch) for the
+                             (V, L) work arrays; must not be shared across threads
 
     Returns:
         single_cycle : (L,) float32 mono buffer (one tile cycle)
     """
-    path_length = len(scan_path)
+    path_length = len(freq_path)
     if path_length == 0:
         return np.zeros(0, dtype=np.float32)
 
-    num_voices = int(config.num_voices)
+    num_voices = len(voice_phases)
     sample_rate = float(config.sample_rate)
-    fmin, fmax = float(config.fmin), float(config.fmax)
-
-    # Sample indices for one cycle: s = 0 .. L-1
-    s = np.arange(path_length, dtype=np.float64)  # (L,)
 
-    # Broadcast phases/steps to (V, L):
+    # Path positions stay float64: they index up to L and are only (V,).
     voice_phases = np.asarray(voice_phases, dtype=np.float64)  # (V,)
     voice_steps = np.asarray(voice_steps, dtype=np.float64)    # (V,)
 
-    # phase_matrix[v, s] = voice_phases[v] + s * voice_steps[v]
-    phase_matrix = voice_phases[:, None] + voice_steps[:, None] * s[None, :]  # (V, L)
-    path_idx = np.floor(phase_matrix).astype(np.int64) % path_length          # (V, L)
-
-    # Lookup scan_path coordinates per voice/sample
-    coords = scan_path[path_idx]  # (V, L, 2)
-    ys = coords[..., 0]
-    xs = coords[..., 1]
-
-    # Gather pixel values for all voices and samples: pixels shape (V, L, 3)
-    pixels = tile_data[ys, xs]  # (V, L, 3)
-    r = pixels[..., 0]
-    g = pixels[..., 1]
-    b = pixels[..., 2]
-
-    # ---- Pixel -> scalar mapping (vectorized) ----
-    # Grayscale luminance (approx) in [0,1]
-    gray_val = 0.2126 * r + 0.7152 * g + 0.0722 * b
-    gray_val = np.clip(gray_val, 0.0, 1.0)
-
-    # HSV-like value: use max channel as simple V substitute
-    hsv_val = np.maximum(np.maximum(r, g), b)
-    hsv_val = np.clip(hsv_val, 0.0, 1.0)
-
-    if config.mode == "grayscale":
-        scalar = gray_val
-    elif config.mode == "hsv":
-        # Simple blend between gray and "V" based on hsv_blend
-        blend = float(np.clip(config.hsv_blend, 0.0, 1.0))
-        scalar = (1.0 - blend) * gray_val + blend * hsv_val
-    else:
-        # Fallback: use full blend helper on per-voice basis if needed
-        # For now, approximate with gray_val.
-        scalar = gray_val
+    if np.all(voice_steps == 1.0):
+        # One path index per sample: voice v reads freq_path rotated by its
+        # integer start, so no (V, L) index matrix is needed.
+        starts = np.floor(voice_phases).astype(np.int64) % path_length  # (V,)
+        if _kernels.HAVE_NUMBA:
+            # Fused oscillator + mix: no (V, L) intermediates at all.
+            mixed = _kernels.render_cycle_numba(
+                freq_path, starts, osc_initial_phases, sample_rate
+            )
+            return mixed
+
+        # Voices are independent: render them concurrently, mix in voice order.
+        max_workers = max(1, min(num_voices, os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            voice_samples = pool.map(
+                _render_one_voice,
+                repeat(freq_path),
+                starts.tolist(),
+                np.asarray(osc_initial_phases, dtype=np.float64).tolist(),
+                repeat(sample_rate),
+            )
+            mixed = next(voice_samples).copy()
+            for samples in voice_samples:
+                mixed += samples
+        mixed /= np.float32(num_voices)
+        return mixed
+
+    # ---- Per-voice frequency lookup (general step) ----
+    shape = (num_voices, path_length)
 
-    # ---- Scalar -> frequency (vectorized) ----
-    freq_cycle = fmin + scalar * (fmax - fmin)  # (V, L)
+    # phase_matrix[v, s] = voice_phases[v] + s * voice_steps[v]
+    s = np.arange(path_length, dtype=np.float64)  # (L,)
+    phase_matrix = _scratch_buffer(scratch, "phase_matrix", shape, np.float64)
+    np.multiply(voice_steps[:, None], s[None, :], out=phase_matrix)
+    phase_matrix += voice_phases[:, None]
+    np.floor(phase_matrix, out=phase_matrix)
+    path_idx = _scratch_buffer(scratch, "path_idx", shape, np.int64)
+    np.copyto(path_idx, phase_matrix, casting="unsafe")
+    np.mod(path_idx, path_length, out=path_idx)
+    freq_cycle = _scratch_buffer(scratch, "freq_cycle", shape, np.float32)
+    np.take(freq_path, path_idx, out=freq_cycle)
 
     # ---- Build oscillator phases per voice/sample ----
-    # increments[v, s] = freq_cycle[v, s] / sample_rate
-    increments = freq_cycle / sample_rate  # (V, L)
-    cumsum_incr = np.cumsum(increments, axis=1)  # (V, L)
+    # increments[v, s] = freq_cycle[v, s] / sample_rate (in place, float32)
+    increments = freq_cycle
+    np.multiply(freq_cycle, np.float32(1.0 / sample_rate), out=increments)
 
     # We want osc_phase[v, s] = osc_initial_phases[v] + sum_{t=0..s-1} increments[v, t]
-    # So we shift the cumsum by one and insert 0 at the start.
-    cumsum_shifted = np.concatenate(
-        (
-            np.zeros((num_voices, 1), dtype=np.float64),
-            cumsum_incr[:, :-1],
-        ),
-        axis=1,
-    )  # (V, L)
+    # i.e. the cumsum shifted by one with 0 at the start.
+    # The running sum grows to ~L * fmax / sample_rate, too large for float32
+    # to hold sub-sample phase precision: accumulate in float64, wrap, then
+    # drop back to float32 for the sawtooth and mix.
+    osc_phase_matrix = _scratch_buffer(scratch, "osc_phase_matrix", shape, np.float64)
+    osc_phase_matrix[:, 0] = 0.0
+    np.cumsum(increments[:, :-1], axis=1, dtype=np.float64, out=osc_phase_matrix[:, 1:])
 
     osc_initial_phases = np.asarray(osc_initial_phases, dtype=np.float64)  # (V,)
-    osc_phase_matrix = (osc_initial_phases[:, None] + cumsum_shifted) % 1.0  # (V, L)
+    osc_phase_matrix += osc_initial_phases[:, None]
+    np.mod(osc_phase_matrix, 1.0, out=osc_phase_matrix)
 
     # ---- Generate sawtooth waveform (vectorized) ----
-    osc_samples = 2.0 * osc_phase_matrix - 1.0  # (V, L) in [-1,1]
+    # Reuses the increments buffer: (V, L) float32 in [-1,1]
+    osc_samples = increments
+    np.multiply(osc_phase_matrix, 2.0, out=osc_samples, casting="same_kind")
+    np.subtract(osc_samples, np.float32(1.0), out=osc_samples)
 
     # ---- Mix voices ----
-    mixed = np.sum(osc_samples, axis=0) / float(num_voices)  # (L,)
+    # Fresh (L,) array: the result outlives this call, scratch buffers do not.
+    mixed = np.sum(osc_samples, axis=0)
+    mixed /= np.float32(num_voices)  # (L,) float32
 
-    return mixed.astype(np.float32)
+    return mixed
 
 
-def _apply_internal_loop_crossfade(single_cycle: np.ndarray, sample_rate: int, loop_crossfade_ms: float) -> np.ndarray:
+def _render_single_cycle_threaded(
+    config: EngineConfig,
+    freq_path: np.ndarray,
+    voice_phases: np.ndarray,
+    voice_steps: np.ndarray,
+    osc_initial_phases: np.ndarray,
+    n_workers: int,
+) -> np.ndarray:
     """
-    Apply an internal loop crossfade between the LAST samples and the FIRST samples
-    of the given single_cycle buffer.
+    Same result as _render_single_cycle_vectorized, with the voices partitioned
+    across n_workers threads.
 
-    This is applied on the single cycle so that it can be tiled num_cycles times
-    without creating hard discontinuities.
+    Each worker renders its voices one at a time with NumPy only and sums them
+    into its own partial row; the rows are reduced in worker order at the end.
+    The Numba kernel is not used here: its default threading layer does not
+    support being entered from several threads at once.
+    """
+    path_length = len(freq_path)
+    num_voices = len(voice_phases)
+    if path_length == 0:
+        return np.zeros(0, dtype=np.float32)
 
-    If loop_crossfade_ms <= 0, this is a no-op.
+    sample_rate = float(config.sample_rate)
+    voice_phases = np.asarray(voice_phases, dtype=np.float64)
+    voice_steps = np.asarray(voice_steps, dtype=np.float64)
+    osc_initial_phases = np.asarray(osc_initial_phases, dtype=np.float64)
+
+    groups = [g for g in np.array_split(np.arange(num_voices), max(1, n_workers)) if len(g)]
+    partials = np.zeros((len(groups), path_length), dtype=np.float32)
+
+    def work(row: int, voice_ids: np.ndarray) -> None:
+        for v in voice_ids:
+            if voice_steps[v] == 1.0:
+                start = int(np.floor(voice_phases[v])) % path_length
+                partials[row] += _render_one_voice(
+                    freq_path, start, osc_initial_phases[v], sample_rate
+                )
+            else:
+                # General step, single voice: the NumPy (1, L) path.
+                partials[row] += _render_single_cycle_vectorized(
+                    config, freq_path, voice_phases[v:v + 1],
+                    voice_steps[v:v + 1], osc_initial_phases[v:v + 1],
+                )
+
+    with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+        futures = [
+            pool.submit(work, row, voice_ids)
+            for row, voice_ids in enumerate(groups)
+        ]
+        # .result() re-raises any worker exception instead of leaving its
+        # partial row silently zero.
+        for future in futures:
+            future.result()
+
+    mixed = partials.sum(axis=0)
+    mixed /= np.float32(num_voices)
+    return mixed
+
+
+def _loop_fade_samples(length: int, sample_rate: int, loop_crossfade_ms: float) -> int:
+    """
+    Number of samples in the internal loop crossfade, or 0 when it is a no-op
+    (loop_crossfade_ms <= 0, or a fade too long for the cycle).
     """
     if loop_crossfade_ms <= 0.0:
-        return single_cycle
-
-    length = single_cycle.shape[0]
+        return 0
     fade_samples = int(sample_rate * loop_crossfade_ms / 1000.0)
-
     if fade_samples <= 0 or fade_samples * 2 >= length:
-        return single_cycle
+        return 0
+    return fade_samples
+
+
+def _get_loop_fade_out(engine_state: EngineState, fade_samples: int) -> np.ndarray:
+    """
+    Return the cached fade-out ramp (1 -> 0) of the given length, rebuilding
+    it when sample_rate / loop_crossfade_ms changed its length.
+    """
+    fade_out = engine_state.loop_fade_out
+    if fade_out is None or len(fade_out) != fade_samples:
+        fade_out = np.linspace(1.0, 0.0, fade_samples, endpoint=False, dtype=np.float32)
+        engine_state.loop_fade_out = fade_out
+    return fade_out
+
 
-    out = single_cycle.copy()
+def _apply_internal_loop_crossfade(single_cycle: np.ndarray, fade_out: np.ndarray) -> np.ndarray:
+    """
+    Apply an internal loop crossfade between the LAST samples and the FIRST samples
+    of the given single_cycle buffer, IN PLACE.
 
-    fade_out = np.linspace(1.0, 0.0, fade_samples, endpoint=False, dtype=np.float32)
-    fade_in = np.linspace(0.0, 1.0, fade_samples, endpoint=False, dtype=np.float32)
+    This is applied on the single cycle so that it can be tiled num_cycles times
+    without creating hard discontinuities.
 
-    tail = out[-fade_samples:].copy()
-    head = out[:fade_samples].copy()
+    blended = tail * fade_out + head * (1 - fade_out), computed as
+    head + (tail - head) * fade_out, then written to both ends.
+    """
+    fade_samples = len(fade_out)
+    if fade_samples == 0:
+        return single_cycle
 
-    blended = tail * fade_out + head * fade_in
+    head = single_cycle[:fade_samples]
+    blended = single_cycle[-fade_samples:] - head
+    blended *= fade_out
+    blended += head
 
-    out[-fade_samples:] = blended
-    out[:fade_samples] = blended
+    single_cycle[-fade_samples:] = blended
+    single_cycle[:fade_samples] = blended
 
-    return out
+    return single_cycle
 
 
 # ---------------------------------------------------------------------
@@ -253,58 +441,97 @@ def _apply_internal_loop_crossfade(single_cycle: np.ndarray, sample_rate: int, l
 # ---------------------------------------------------------------------
 
 
-def render_buffer(engine_state: EngineState) -> np.ndarray:
+def _render_cycle(engine_state: EngineState, n_workers: Optional[int]) -> np.ndarray:
     """
-    Render the FULL mono buffer according to engine_state.config.num_cycles.
-
-    Strategy v0.2:
-    - Render a SINGLE tile cycle (one pass on the scan path) using vectorized ops.
-    - Apply an internal loop crossfade on that cycle (config.loop_crossfade_ms).
-    - Repeat that cycle num_cycles times (simple tiling).
-    - Update voice.phase to reflect advancement (osc_phase is not persisted yet).
+    Shared body of render_cycle / render_buffer_parallel: render, crossfade,
+    advance voice phases. n_workers=None uses the default single-call renderer.
     """
     config = engine_state.config
     scan_path = engine_state.scan_path
-    tile_data = engine_state.tile_data
-    voices = engine_state.voices
 
     path_length = len(scan_path)
     if path_length == 0 or config.num_cycles <= 0:
         return np.zeros(0, dtype=np.float32)
 
-    num_voices = max(1, config.num_voices)
     num_samples = path_length * config.num_cycles
 
-    # Vectorized views of voice states
-    voice_phases = np.array([v.phase for v in voices], dtype=np.float64)   # (V,)
-    voice_steps = np.array([v.step for v in voices], dtype=np.float64)     # (V,)
-    osc_initial_phases = np.array([v.osc_phase for v in voices], dtype=np.float64)  # (V,)
-
     # 1) Generate single cycle
-    single_cycle = _render_single_cycle_vectorized(
-        config=config,
-        scan_path=scan_path,
-        tile_data=tile_data,
-        voice_phases=voice_phases,
-        voice_steps=voice_steps,
-        osc_initial_phases=osc_initial_phases,
-    )  # (path_length,)
+    if n_workers is None:
+        single_cycle = _render_single_cycle_vectorized(
+            config=config,
+            freq_path=_get_freq_path(engine_state),
+            voice_phases=engine_state.voice_phase,
+            voice_steps=engine_state.voice_step,
+            osc_initial_phases=engine_state.voice_osc_phase,
+            scratch=engine_state._scratch,
+        )  # (path_length,)
+    else:
+        single_cycle = _render_single_cycle_threaded(
+            config=config,
+            freq_path=_get_freq_path(engine_state),
+            voice_phases=engine_state.voice_phase,
+            voice_steps=engine_state.voice_step,
+            osc_initial_phases=engine_state.voice_osc_phase,
+            n_workers=n_workers,
+        )  # (path_length,)
 
     # 2) Make the cycle loop-friendly
-    single_cycle = _apply_internal_loop_crossfade(
-        single_cycle,
-        sample_rate=config.sample_rate,
-        loop_crossfade_ms=config.loop_crossfade_ms,
-    )
+    # (single_cycle is a fresh buffer, so the crossfade can work in place)
+    fade_samples = _loop_fade_samples(path_length, config.sample_rate, config.loop_crossfade_ms)
+    if fade_samples > 0:
+        single_cycle = _apply_internal_loop_crossfade(
+            single_cycle, _get_loop_fade_out(engine_state, fade_samples)
+        )
+
+    # 3) Update voice_phase (so if we render again, scan continues correctly)
+    total_advances = num_samples * engine_state.voice_step  # (V,)
+    engine_state.voice_phase = (engine_state.voice_phase + total_advances) % path_length
+
+    return single_cycle
+
+
+def render_cycle(engine_state: EngineState) -> np.ndarray:
+    """
+    Render ONE loop-ready tile cycle; the full buffer is this cycle repeated
+    engine_state.config.num_cycles times.
+
+    Voice phases are advanced by the full num_cycles span, exactly as
+    render_buffer does, so callers can stream the cycle out (e.g. straight to
+    a WAV writer) without materializing the tiled buffer.
+    """
+    return _render_cycle(engine_state, n_workers=None)
+
+
+def render_buffer(engine_state: EngineState) -> np.ndarray:
+    """
+    Render the FULL mono buffer according to engine_state.config.num_cycles.
+
+    Strategy v0.2:
+    - Render a SINGLE tile cycle (one pass on the scan path) using vectorized ops.
+    - Apply an internal loop crossfade on that cycle (config.loop_crossfade_ms).
+    - Repeat that cycle num_cycles times (simple tiling).
+    - Update voice_phase to reflect advancement (voice_osc_phase is not persisted yet).
 
-    # 3) Tile the cycle num_cycles times
-    buffer = np.tile(single_cycle, config.num_cycles).astype(np.float32)
+    See render_cycle to avoid holding the full tiled buffer in memory.
+    """
+    single_cycle = render_cycle(engine_state)
+    if single_cycle.size == 0:
+        return single_cycle
+    return np.tile(single_cycle, engine_state.config.num_cycles)
 
-    # 4) Update voice.phase (so if we render again, scan continues correctly)
-    total_advances = num_samples * voice_steps  # (V,)
-    new_phases = (voice_phases + total_advances) % path_length
-    for i, v in enumerate(voices):
-        v.phase = float(new_phases[i])
 
-    return buffer
+def render_buffer_parallel(engine_state: EngineState, n_workers: Optional[int] = None) -> np.ndarray:
+    """
+    Like render_buffer, but the voices are partitioned across n_workers
+    threads (default: CPU count). A failure in any worker is re-raised.
 
+    On a free-threaded CPython build (3.13t) this scales with the number of
+    cores; on the default build it only gains where the per-voice NumPy work
+    releases the GIL.
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    single_cycle = _render_cycle(engine_state, n_workers=max(1, int(n_workers)))
+    if single_cycle.size == 0:
+        return single_cycle
+    return np.tile(single_cycle, engine_state.config.num_cycles)
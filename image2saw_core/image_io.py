@@ -12,7 +12,10 @@ def load_image(path: str) -> np.ndarray:
     Image dimensions: (height, width, channels), normalized to [0–1].
     """
     img = Image.open(path).convert("RGB")
-    arr = np.array(img, dtype=np.float32) / 255.0
+    pixels = np.asarray(img, dtype=np.uint8)
+    # Single float32 pass: multiply by 1/255 straight from uint8.
+    arr = np.empty(pixels.shape, dtype=np.float32)
+    np.multiply(pixels, np.float32(1.0 / 255.0), out=arr)
     return arr
 
 
@@ -15,14 +15,9 @@ def build_scan_path(width: int, height: int, pattern: str = "zigzag") -> np.ndar
     Returns a 2D array of pixel coordinates: np.ndarray[(N, 2)].
     Path is considered circular (continuous wrapping).
     """
-    coords = []
-    for y in range(height):
-        if pattern == "zigzag" and y % 2 == 1:
-            # Odd rows: right to left
-            for x in range(width - 1, -1, -1):
-                coords.append([y, x])
-        else:
-            # Even rows (or raster pattern): left to right
-            for x in range(width):
-                coords.append([y, x])
-    return np.array(coords, dtype=np.int32)
+    xs = np.broadcast_to(np.arange(width, dtype=np.int32), (height, width)).copy()
+    if pattern == "zigzag":
+        # Odd rows: right to left
+        xs[1::2] = xs[1::2, ::-1]
+    ys = np.broadcast_to(np.arange(height, dtype=np.int32)[:, None], (height, width))
+    return np.stack([ys, xs], axis=-1).reshape(-1, 2)
@@ -0,0 +1,35 @@
+"""
+test_quantize.py: int16 quantization saturates identically on both paths.
+"""
+
+import numpy as np
+import pytest
+
+from image2saw_core import _kernels, quantize_int16
+
+EDGE_SAMPLES = np.array(
+    [1.5, -1.5, 1e20, -1e20, np.inf, -np.inf, 1.0, -1.0, 0.5, -0.99999, 0.0],
+    dtype=np.float32,
+)
+
+
+def _reference(data: np.ndarray) -> np.ndarray:
+    return (np.clip(data, -1.0, 1.0) * 32767.0).astype(np.int16)
+
+
+def test_numpy_path_saturates(monkeypatch):
+    monkeypatch.setattr(_kernels, "HAVE_NUMBA", False)
+    np.testing.assert_array_equal(quantize_int16(EDGE_SAMPLES), _reference(EDGE_SAMPLES))
+
+
+@pytest.mark.skipif(not _kernels.HAVE_NUMBA, reason="numba not installed")
+def test_numba_path_matches_numpy_path(monkeypatch):
+    rng = np.random.default_rng(0)
+    data = np.concatenate([EDGE_SAMPLES, rng.uniform(-1.5, 1.5, 10_000).astype(np.float32)])
+
+    numba_out = quantize_int16(data)
+    monkeypatch.setattr(_kernels, "HAVE_NUMBA", False)
+    numpy_out = quantize_int16(data)
+
+    np.testing.assert_array_equal(numba_out, numpy_out)
+    np.testing.assert_array_equal(numba_out, _reference(data))
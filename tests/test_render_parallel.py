@@ -0,0 +1,43 @@
+"""
+test_render_parallel.py: thread-partitioned rendering matches and fails loudly.
+"""
+
+import numpy as np
+import pytest
+
+from image2saw_core import (
+    EngineConfig,
+    full_image_tile,
+    init_engine_state,
+    render_buffer,
+    render_buffer_parallel,
+)
+from image2saw_core import engine
+
+
+def _state():
+    image = np.random.default_rng(1).random((15, 16, 3), dtype=np.float32)
+    config = EngineConfig(
+        sample_rate=8000, num_voices=4, fmin=200.0, fmax=1000.0,
+        mode="hsv", hsv_blend=0.5, num_cycles=2,
+    )
+    return init_engine_state(full_image_tile(image), config)
+
+
+def test_parallel_matches_render_buffer():
+    expected = render_buffer(_state())
+    actual = render_buffer_parallel(_state(), n_workers=3)
+    np.testing.assert_allclose(actual, expected, atol=1e-5)
+
+
+def test_worker_failure_is_raised(monkeypatch):
+    def fail(*args, **kwargs):
+        raise MemoryError("injected")
+
+    monkeypatch.setattr(engine, "_render_one_voice", fail)
+    engine_state = _state()
+    phases_before = engine_state.voice_phase.copy()
+
+    with pytest.raises(MemoryError, match="injected"):
+        render_buffer_parallel(engine_state, n_workers=3)
+    np.testing.assert_array_equal(engine_state.voice_phase, phases_before)